@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, List, Union
+from functools import singledispatch
+from typing import Any, List, Union, cast
 
 from splink.internals.blocking import BlockingRule
 from splink.internals.blocking_rule_creator import BlockingRuleCreator
@@ -9,14 +10,21 @@ from splink.internals.misc import ensure_is_iterable
 from .blocking_rule_library import CustomRule
 
 
+@singledispatch
 def to_blocking_rule_creator(
     blocking_rule_creator: Union[dict[str, Any], str, BlockingRuleCreator],
 ) -> BlockingRuleCreator:
-    if isinstance(blocking_rule_creator, dict):
-        return CustomRule(**blocking_rule_creator)
-    if isinstance(blocking_rule_creator, str):
-        return CustomRule(blocking_rule_creator)
-    return blocking_rule_creator
+    # dicts and strings are converted by the implementations registered below.
+    # Anything else is assumed to already be a BlockingRuleCreator
+    return cast(BlockingRuleCreator, blocking_rule_creator)
+
+
+@to_blocking_rule_creator.register(dict)
+def _custom_rule_from_dict(blocking_rule_dict: dict[str, Any]) -> CustomRule:
+    return CustomRule(**blocking_rule_dict)
+
+
+to_blocking_rule_creator.register(str, CustomRule)
 
 
 def blocking_rule_args_to_list_of_blocking_rules(
@@ -33,8 +41,7 @@ def blocking_rule_args_to_list_of_blocking_rules(
 
     This function converts the input to a list of BlockingRule objects
     """
-    rules_as_creators = [
-        to_blocking_rule_creator(br) for br in ensure_is_iterable(blocking_rule_args)
+    return [
+        to_blocking_rule_creator(br).get_blocking_rule(sql_dialect)
+        for br in ensure_is_iterable(blocking_rule_args)
     ]
-    rules_as_brs = [br.get_blocking_rule(sql_dialect) for br in rules_as_creators]
-    return rules_as_brs
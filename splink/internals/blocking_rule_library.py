@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Union, final
+from typing import Any, Optional, Union, final
 
 from sqlglot import TokenError, parse_one
 
 from splink.internals.blocking_rule_creator import BlockingRuleCreator
+from splink.internals.blocking_rule_py_predicate import (
+    PyPredicate,
+    compile_py_predicate,
+)
 from splink.internals.column_expression import ColumnExpression
 from splink.internals.dialects import SplinkDialect
 
@@ -89,6 +93,15 @@ class CustomRule(BlockingRuleCreator):
 
         self.base_dialect_str = sql_dialect
 
+    @property
+    def py_predicate(self) -> Optional[PyPredicate]:
+        """Python equivalent of the rule, taking the left and right records as
+        mappings. None unless the rule is of a simple form, see
+        `compile_py_predicate`
+        """
+        # compiled on first use, and cached on the rule text
+        return compile_py_predicate(self.sql_condition)
+
     def create_sql(self, sql_dialect: SplinkDialect) -> str:
         sql_condition = self.sql_condition
         if self.base_dialect_str is not None:
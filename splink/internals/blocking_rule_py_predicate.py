@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional
+
+from sqlglot import ParseError, TokenError, exp, parse_one
+
+PyPredicate = Callable[[Mapping[str, Any], Mapping[str, Any]], bool]
+
+
+def _py_eq(left: Any, right: Any) -> bool:
+    # mirror SQL semantics, where a comparison involving a null is never true
+    return left is not None and right is not None and left == right
+
+
+# string functions cast their argument to a string first, as SQL does implicitly
+# for e.g. integer or date columns
+
+
+def _py_substr(value: Any, start: int, length: Optional[int] = None) -> Any:
+    if value is None:
+        return None
+    value = str(value)
+    if length is None:
+        return value[start - 1 :]
+    return value[start - 1 : start - 1 + length]
+
+
+def _py_lower(value: Any) -> Any:
+    return None if value is None else str(value).lower()
+
+
+def _py_upper(value: Any) -> Any:
+    return None if value is None else str(value).upper()
+
+
+_PY_PREDICATE_NAMESPACE = {
+    "_eq": _py_eq,
+    "_substr": _py_substr,
+    "_lower": _py_lower,
+    "_upper": _py_upper,
+}
+
+
+def _positive_int_literal(node: Optional[exp.Expression]) -> Optional[int]:
+    if not isinstance(node, exp.Literal) or node.is_string:
+        return None
+    try:
+        value = int(node.this)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def _side_to_py_source(node: exp.Expression) -> Optional[tuple[str, str]]:
+    """Translate one side of an equality into python source, returning the
+    source along with the table alias (`l` or `r`) it refers to.
+    Returns None if the expression is not of a supported form
+    """
+    if isinstance(node, exp.Column):
+        # a qualified reference such as `x.l.a` is not to the left/right record
+        if node.db or node.catalog:
+            return None
+        table = node.table.lower()
+        if table not in ("l", "r"):
+            return None
+        # unquoted identifiers are case-insensitive in SQL, so we could not know
+        # which key to look up unless the name is already in normalised form
+        if not node.this.quoted and node.name != node.name.lower():
+            return None
+        return f"{table.upper()}[{node.name!r}]", table
+
+    if isinstance(node, (exp.Lower, exp.Upper)):
+        inner = _side_to_py_source(node.this)
+        if inner is None:
+            return None
+        fn = "_lower" if isinstance(node, exp.Lower) else "_upper"
+        return f"{fn}({inner[0]})", inner[1]
+
+    if isinstance(node, exp.Substring):
+        column, start, length = (
+            node.this,
+            node.args.get("start"),
+            node.args.get("length"),
+        )
+    elif isinstance(node, exp.Anonymous) and node.name.lower() in (
+        "substr",
+        "substring",
+    ):
+        if len(node.expressions) not in (2, 3):
+            return None
+        column, start, *rest = node.expressions
+        length = rest[0] if rest else None
+    else:
+        return None
+
+    inner = _side_to_py_source(column)
+    start_value = _positive_int_literal(start)
+    if inner is None or start_value is None:
+        return None
+    if length is None:
+        return f"_substr({inner[0]}, {start_value})", inner[1]
+    length_value = _positive_int_literal(length)
+    if length_value is None:
+        return None
+    return f"_substr({inner[0]}, {start_value}, {length_value})", inner[1]
+
+
+def _conjunct_to_py_source(node: exp.Expression) -> Optional[str]:
+    while isinstance(node, exp.Paren):
+        node = node.this
+
+    if isinstance(node, exp.And):
+        left = _conjunct_to_py_source(node.this)
+        right = _conjunct_to_py_source(node.expression)
+        if left is None or right is None:
+            return None
+        return f"{left} and {right}"
+
+    if not isinstance(node, exp.EQ):
+        return None
+
+    left_side = _side_to_py_source(node.this)
+    right_side = _side_to_py_source(node.expression)
+    if left_side is None or right_side is None or left_side[1] == right_side[1]:
+        return None
+    return f"_eq({left_side[0]}, {right_side[0]})"
+
+
+@lru_cache(maxsize=1024)
+def compile_py_predicate(sql_text: str) -> Optional[PyPredicate]:
+    """Attempt to compile a blocking rule into an equivalent python predicate.
+
+    Only rules which are a conjunction of equalities between the left and right
+    record are supported, where each side is a column optionally wrapped in
+    `lower`, `upper` or `substr` with literal arguments, e.g.
+    `l.first_name = r.first_name and substr(l.dob, 1, 4) = substr(r.dob, 1, 4)`.
+    Unquoted column names must be lowercase, matching the keys of the records.
+
+    The predicate takes the left and right records as mappings of column name to
+    value.  Returns None if the rule is not of a supported form, in which case the
+    rule can only be evaluated in SQL.
+    """
+    try:
+        tree = parse_one(sql_text)
+    except (ParseError, TokenError):
+        return None
+
+    body = _conjunct_to_py_source(tree)
+    if body is None:
+        return None
+
+    code = compile(f"lambda L, R: {body}", "<blocking_rule>", "eval")
+    return eval(code, dict(_PY_PREDICATE_NAMESPACE))
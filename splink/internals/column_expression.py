@@ -15,6 +15,9 @@ from splink.internals.sql_transform import (
     add_table_to_all_column_identifiers,
 )
 
+# anything that looks like a function call, e.g. `lower(first_name)`
+_BRACKETED_EXPRESSION_REGEX = re.compile(r"\([^)]*\)")
+
 
 class ColumnExpressionOperation(Protocol):
     def __call__(self, name: str, sql_dialect: SplinkDialect) -> str: ...
@@ -93,7 +96,7 @@ class ColumnExpression:
         # expression), since lower(first_name) could technically be a column name
         # Here I use a heuristic:
         # If there's a () or || then assume it's a sql expression
-        if re.search(r"\([^)]*\)", self.raw_sql_expression):
+        if _BRACKETED_EXPRESSION_REGEX.search(self.raw_sql_expression):
             return False
 
         if "||" in self.raw_sql_expression:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from copy import copy
 from typing import Any, Dict, List, Optional, Union, final
 
 from splink.internals.column_expression import ColumnExpression
@@ -15,6 +16,15 @@ from .comparison_level_creator import (
 
 
 class ComparisonCreator(ABC):
+    __slots__ = (
+        "col_expressions",
+        "_term_frequency_adjustments",
+        "_m_probabilities",
+        "_u_probabilities",
+        "_cached_comparison_levels",
+        "_cached_description",
+    )
+
     DEFAULT_COL_EXP_KEY = "__default__"
 
     def __init__(
@@ -66,17 +76,30 @@ class ComparisonCreator(ABC):
         return col_expression
 
     def _validate(self) -> None:
-        # create levels - let them raise errors if there are issues
+        # create levels - let them raise errors if there are issues.
+        # Not cached: subclasses may still set state after calling
+        # super().__init__(), which the levels must reflect
         self.create_comparison_levels()
 
     @abstractmethod
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
         pass
 
+    @final
+    def _get_comparison_levels(self) -> List[ComparisonLevelCreator]:
+        # built on first use, rather than during __init__, so that they reflect
+        # any state set after construction. After that they are reused.
+        # These are shared, so should be copied before being modified
+        if (levels := getattr(self, "_cached_comparison_levels", None)) is None:
+            levels = self.create_comparison_levels()
+            self._cached_comparison_levels = levels
+        return levels
+
     @final
     def get_configured_comparison_levels(self) -> List[ComparisonLevelCreator]:
         # furnish comparison levels with m and u probabilities as needed
-        comparison_levels = self.create_comparison_levels()
+        # copy levels, as configuring them would otherwise alter the cached levels
+        comparison_levels = [copy(cl) for cl in self._get_comparison_levels()]
 
         if self.term_frequency_adjustments:
             for cl in comparison_levels:
@@ -108,18 +131,24 @@ class ComparisonCreator(ABC):
     @final
     @property
     def num_levels(self) -> int:
-        return len(self.create_comparison_levels())
+        return len(self._get_comparison_levels())
 
     @final
     @property
     def num_non_null_levels(self) -> int:
-        return len(
-            [cl for cl in self.create_comparison_levels() if not cl.is_null_level]
-        )
+        return len([cl for cl in self._get_comparison_levels() if not cl.is_null_level])
 
     def create_description(self) -> str:
         return self.__class__.__name__
 
+    @final
+    def _get_description(self) -> str:
+        # as with levels, the description is fixed once the creator is constructed
+        if (description := getattr(self, "_cached_description", None)) is None:
+            description = self.create_description()
+            self._cached_description = description
+        return description
+
     @abstractmethod
     def create_output_column_name(self) -> Optional[str]:
         # should be str where possible, otherwise a default will be created
@@ -137,7 +166,7 @@ class ComparisonCreator(ABC):
     @final
     def create_comparison_dict(self, sql_dialect_str: str) -> dict[str, Any]:
         level_dict = {
-            "comparison_description": self.create_description(),
+            "comparison_description": self._get_description(),
             "output_column_name": self.create_output_column_name(),
             "comparison_levels": [
                 cl.get_comparison_level(sql_dialect_str)
@@ -253,7 +282,7 @@ class ComparisonCreator(ABC):
 
     def __repr__(self) -> str:
         return (
-            f"Comparison generator for {self.create_description()}. "
+            f"Comparison generator for {self._get_description()}. "
             "Call .get_comparison(sql_dialect_str) to instantiate "
             "a Comparison"
         )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import copy
 from functools import wraps
 from typing import Any, Callable, List, Literal, TypeVar, Union
 
@@ -18,6 +17,23 @@ from .comparison_level_creator import ComparisonLevelCreator
 T = TypeVar("T", bound=ComparisonLevelCreator)
 CreateSQLFunctionType = Callable[[T, SplinkDialect], str]
 
+# keys of a `CustomLevel` dict which are passed to `.configure()` rather than
+# to the constructor
+_CUSTOM_LEVEL_CONFIGURABLE_PARAMETERS = frozenset(
+    (
+        "is_null_level",
+        "m_probability",
+        "u_probability",
+        "tf_adjustment_column",
+        "tf_adjustment_weight",
+        "tf_minimum_u_value",
+        "label_for_charts",
+        "disable_tf_exact_match_detection",
+        "fix_m_probability",
+        "fix_u_probability",
+    )
+)
+
 
 def unsupported_splink_dialects(
     unsupported_dialects: List[str],
@@ -197,41 +213,29 @@ class CustomLevel(ComparisonLevelCreator):
         if isinstance(cl, ComparisonLevelCreator):
             return cl
         if isinstance(cl, dict):
-            # TODO: swap this if we develop a more uniform approach to (de)serialising
-            cl_dict = copy(cl)
-            configurable_parameters = (
-                "is_null_level",
-                "m_probability",
-                "u_probability",
-                "tf_adjustment_column",
-                "tf_adjustment_weight",
-                "tf_minimum_u_value",
-                "label_for_charts",
-                "disable_tf_exact_match_detection",
-                "fix_m_probability",
-                "fix_u_probability",
-            )
-            # split dict in two depending whether or not entries are 'configurables'
-            configurables = {
-                key: value
-                for key, value in cl_dict.items()
-                if key in configurable_parameters
-            }
-            cl_dict = {
-                key: value
-                for key, value in cl_dict.items()
-                if key not in configurable_parameters
-            }
-
-            custom_comparison = CustomLevel(**cl_dict)
-            if configurables:
-                custom_comparison.configure(**configurables)
-            return custom_comparison
+            return CustomLevel._from_dict(cl)
         raise ValueError(
             "`comparison_levels` entries must be `dict` or `ComparisonLevelCreator, "
             f"but found type {type(cl)} for entry {cl}"
         )
 
+    @staticmethod
+    def _from_dict(cl: dict[str, Any]) -> "CustomLevel":
+        # TODO: swap this if we develop a more uniform approach to (de)serialising
+        # split dict in two depending whether or not entries are 'configurables'
+        cl_dict = {}
+        configurables = {}
+        for key, value in cl.items():
+            if key in _CUSTOM_LEVEL_CONFIGURABLE_PARAMETERS:
+                configurables[key] = value
+            else:
+                cl_dict[key] = value
+
+        custom_comparison = CustomLevel(**cl_dict)
+        if configurables:
+            custom_comparison.configure(**configurables)
+        return custom_comparison
+
 
 class ExactMatchLevel(ComparisonLevelCreator):
     def __init__(
@@ -419,6 +423,10 @@ class LevenshteinLevel(ComparisonLevelCreator):
 
     def create_sql(self, sql_dialect: SplinkDialect) -> str:
         self.col_expression.sql_dialect = sql_dialect
+        # If the dialect has a bounded levenshtein function, use it
+        if hasattr(sql_dialect, "levenshtein_at_threshold"):
+            return sql_dialect.levenshtein_at_threshold(self)
+
         col = self.col_expression
         lev_fn = sql_dialect.levenshtein_function_name
         return f"{lev_fn}({col.name_l}, {col.name_r}) <= {self.distance_threshold}"
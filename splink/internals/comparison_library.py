@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Iterable, List, Optional, Union
 
 from splink.internals import comparison_level_library as cll
@@ -11,6 +12,24 @@ from splink.internals.dialects import SplinkDialect
 from splink.internals.misc import ensure_is_iterable
 
 
+def _as_tuple(value_or_values: Any) -> tuple[Any, ...]:
+    """Thresholds and metrics may be supplied as a single value or an iterable.
+    Unpack to a tuple so we can repeat iteration if needed"""
+    # fast path for the common case of a single numeric threshold
+    if isinstance(value_or_values, (int, float)):
+        return (value_or_values,)
+    return tuple(ensure_is_iterable(value_or_values))
+
+
+def _null_and_exact_match_levels(
+    col_expression: ColumnExpression,
+) -> tuple[ComparisonLevelCreator, ComparisonLevelCreator]:
+    """The null and exact match levels that open most single-column comparisons.
+    Levels are mutable (via `.configure()`), so these are built fresh each time
+    rather than shared between comparisons"""
+    return cll.NullLevel(col_expression), cll.ExactMatchLevel(col_expression)
+
+
 class ExactMatch(ComparisonCreator):
     """
     Represents a comparison of the data in `col_name` with two levels:
@@ -22,6 +41,8 @@ class ExactMatch(ComparisonCreator):
         col_name (str): The name of the column to compare
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         col_name: str,
@@ -30,8 +51,7 @@ class ExactMatch(ComparisonCreator):
 
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
         return [
-            cll.NullLevel(self.col_expression),
-            cll.ExactMatchLevel(self.col_expression),
+            *_null_and_exact_match_levels(self.col_expression),
             cll.ElseLevel(),
         ]
 
@@ -40,6 +60,8 @@ class ExactMatch(ComparisonCreator):
 
 
 class LevenshteinAtThresholds(ComparisonCreator):
+    __slots__ = ("thresholds",)
+
     def __init__(
         self,
         col_name: str,
@@ -67,15 +89,12 @@ class LevenshteinAtThresholds(ComparisonCreator):
                 Defaults to [1, 2].
         """
 
-        thresholds_as_iterable = ensure_is_iterable(distance_threshold_or_thresholds)
-        # unpack it to a list so we can repeat iteration if needed
-        self.thresholds = [*thresholds_as_iterable]
+        self.thresholds = _as_tuple(distance_threshold_or_thresholds)
         super().__init__(col_name)
 
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
         return [
-            cll.NullLevel(self.col_expression),
-            cll.ExactMatchLevel(self.col_expression),
+            *_null_and_exact_match_levels(self.col_expression),
             *[
                 cll.LevenshteinLevel(self.col_expression, threshold)
                 for threshold in self.thresholds
@@ -88,6 +107,8 @@ class LevenshteinAtThresholds(ComparisonCreator):
 
 
 class DamerauLevenshteinAtThresholds(ComparisonCreator):
+    __slots__ = ("thresholds", "_thresholds_str")
+
     def __init__(
         self,
         col_name: str,
@@ -115,14 +136,13 @@ class DamerauLevenshteinAtThresholds(ComparisonCreator):
                 Defaults to [1, 2].
         """
 
-        thresholds_as_iterable = ensure_is_iterable(distance_threshold_or_thresholds)
-        self.thresholds = [*thresholds_as_iterable]
+        self.thresholds = _as_tuple(distance_threshold_or_thresholds)
+        self._thresholds_str = ", ".join(str(t) for t in self.thresholds)
         super().__init__(col_name)
 
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
         return [
-            cll.NullLevel(self.col_expression),
-            cll.ExactMatchLevel(self.col_expression),
+            *_null_and_exact_match_levels(self.col_expression),
             *[
                 cll.DamerauLevenshteinLevel(self.col_expression, threshold)
                 for threshold in self.thresholds
@@ -131,11 +151,10 @@ class DamerauLevenshteinAtThresholds(ComparisonCreator):
         ]
 
     def create_description(self) -> str:
-        comma_separated_thresholds_string = ", ".join(map(str, self.thresholds))
         return (
             f"Exact match '{self.col_expression.label}' vs. "
             f"Damerau-Levenshtein distance at thresholds "
-            f"{comma_separated_thresholds_string} vs. "
+            f"{self._thresholds_str} vs. "
             "anything else"
         )
 
@@ -144,6 +163,8 @@ class DamerauLevenshteinAtThresholds(ComparisonCreator):
 
 
 class JaccardAtThresholds(ComparisonCreator):
+    __slots__ = ("thresholds",)
+
     def __init__(
         self,
         col_name: str,
@@ -171,14 +192,12 @@ class JaccardAtThresholds(ComparisonCreator):
                 Defaults to [0.9, 0.7].
         """
 
-        thresholds_as_iterable = ensure_is_iterable(score_threshold_or_thresholds)
-        self.thresholds = [*thresholds_as_iterable]
+        self.thresholds = _as_tuple(score_threshold_or_thresholds)
         super().__init__(col_name)
 
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
         return [
-            cll.NullLevel(self.col_expression),
-            cll.ExactMatchLevel(self.col_expression),
+            *_null_and_exact_match_levels(self.col_expression),
             *[
                 cll.JaccardLevel(self.col_expression, threshold)
                 for threshold in self.thresholds
@@ -191,6 +210,8 @@ class JaccardAtThresholds(ComparisonCreator):
 
 
 class JaroAtThresholds(ComparisonCreator):
+    __slots__ = ("thresholds",)
+
     def __init__(
         self,
         col_name: str,
@@ -218,14 +239,12 @@ class JaroAtThresholds(ComparisonCreator):
                 Defaults to [0.9, 0.7].
         """
 
-        thresholds_as_iterable = ensure_is_iterable(score_threshold_or_thresholds)
-        self.thresholds = [*thresholds_as_iterable]
+        self.thresholds = _as_tuple(score_threshold_or_thresholds)
         super().__init__(col_name)
 
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
         return [
-            cll.NullLevel(self.col_expression),
-            cll.ExactMatchLevel(self.col_expression),
+            *_null_and_exact_match_levels(self.col_expression),
             *[
                 cll.JaroLevel(self.col_expression, threshold)
                 for threshold in self.thresholds
@@ -238,6 +257,8 @@ class JaroAtThresholds(ComparisonCreator):
 
 
 class JaroWinklerAtThresholds(ComparisonCreator):
+    __slots__ = ("thresholds",)
+
     def __init__(
         self,
         col_name: str,
@@ -265,14 +286,12 @@ class JaroWinklerAtThresholds(ComparisonCreator):
                 Defaults to [0.9, 0.7].
         """
 
-        thresholds_as_iterable = ensure_is_iterable(score_threshold_or_thresholds)
-        self.thresholds = [*thresholds_as_iterable]
+        self.thresholds = _as_tuple(score_threshold_or_thresholds)
         super().__init__(col_name)
 
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
         return [
-            cll.NullLevel(self.col_expression),
-            cll.ExactMatchLevel(self.col_expression),
+            *_null_and_exact_match_levels(self.col_expression),
             *[
                 cll.JaroWinklerLevel(self.col_expression, threshold)
                 for threshold in self.thresholds
@@ -285,6 +304,8 @@ class JaroWinklerAtThresholds(ComparisonCreator):
 
 
 class DistanceFunctionAtThresholds(ComparisonCreator):
+    __slots__ = ("thresholds", "distance_function_name", "higher_is_more_similar")
+
     def __init__(
         self,
         col_name: str,
@@ -319,16 +340,14 @@ class DistanceFunctionAtThresholds(ComparisonCreator):
                 Default is True
         """
 
-        thresholds_as_iterable = ensure_is_iterable(distance_threshold_or_thresholds)
-        self.thresholds = [*thresholds_as_iterable]
+        self.thresholds = _as_tuple(distance_threshold_or_thresholds)
         self.distance_function_name = distance_function_name
         self.higher_is_more_similar = higher_is_more_similar
         super().__init__(col_name)
 
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
         return [
-            cll.NullLevel(self.col_expression),
-            cll.ExactMatchLevel(self.col_expression),
+            *_null_and_exact_match_levels(self.col_expression),
             *[
                 cll.DistanceFunctionLevel(
                     self.col_expression,
@@ -346,6 +365,15 @@ class DistanceFunctionAtThresholds(ComparisonCreator):
 
 
 class AbsoluteTimeDifferenceAtThresholds(ComparisonCreator):
+    __slots__ = (
+        "time_metrics",
+        "time_thresholds",
+        "_threshold_metric_pairs",
+        "input_is_string",
+        "invalid_dates_as_null",
+        "datetime_format",
+    )
+
     def __init__(
         self,
         col_name: str,
@@ -393,12 +421,8 @@ class AbsoluteTimeDifferenceAtThresholds(ComparisonCreator):
             invalid_dates_as_null (bool, optional): If True and `input_is_string` is
                 True, treat invalid dates as null. Defaults to True.
         """
-        time_metrics_as_iterable = ensure_is_iterable(metrics)
-        # unpack it to a list so we can repeat iteration if needed
-        self.time_metrics = [*time_metrics_as_iterable]
-
-        time_thresholds_as_iterable = ensure_is_iterable(thresholds)
-        self.time_thresholds = [*time_thresholds_as_iterable]
+        self.time_metrics = _as_tuple(metrics)
+        self.time_thresholds = _as_tuple(thresholds)
 
         num_metrics = len(self.time_metrics)
         num_thresholds = len(self.time_thresholds)
@@ -412,6 +436,9 @@ class AbsoluteTimeDifferenceAtThresholds(ComparisonCreator):
                 "`time_thresholds` and `time_metrics` must have "
                 "the same number of entries"
             )
+        self._threshold_metric_pairs = tuple(
+            zip(self.time_thresholds, self.time_metrics)
+        )
 
         self.input_is_string = input_is_string
 
@@ -455,9 +482,7 @@ class AbsoluteTimeDifferenceAtThresholds(ComparisonCreator):
                     metric=time_metric,
                     datetime_format=self.datetime_format,
                 )
-                for (time_threshold, time_metric) in zip(
-                    self.time_thresholds, self.time_metrics
-                )
+                for (time_threshold, time_metric) in self._threshold_metric_pairs
             ],
             cll.ElseLevel(),
         ]
@@ -467,6 +492,8 @@ class AbsoluteTimeDifferenceAtThresholds(ComparisonCreator):
 
 
 class AbsoluteDateDifferenceAtThresholds(AbsoluteTimeDifferenceAtThresholds):
+    __slots__ = ()
+
     @property
     def datetime_parse_function(self):
         return self.col_expression.try_parse_date
@@ -477,6 +504,8 @@ class AbsoluteDateDifferenceAtThresholds(AbsoluteTimeDifferenceAtThresholds):
 
 
 class ArrayIntersectAtSizes(ComparisonCreator):
+    __slots__ = ("thresholds",)
+
     def __init__(
         self,
         col_name: str,
@@ -503,8 +532,7 @@ class ArrayIntersectAtSizes(ComparisonCreator):
                 Defaults to [1].
         """
 
-        thresholds_as_iterable = ensure_is_iterable(size_threshold_or_thresholds)
-        self.thresholds = [*thresholds_as_iterable]
+        self.thresholds = _as_tuple(size_threshold_or_thresholds)
         super().__init__(col_name)
 
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
@@ -522,6 +550,8 @@ class ArrayIntersectAtSizes(ComparisonCreator):
 
 
 class DistanceInKMAtThresholds(ComparisonCreator):
+    __slots__ = ("thresholds",)
+
     def __init__(
         self,
         lat_col: str,
@@ -545,8 +575,7 @@ class DistanceInKMAtThresholds(ComparisonCreator):
                 distance levels.
         """
 
-        thresholds_as_iterable = ensure_is_iterable(km_thresholds)
-        self.thresholds = [*thresholds_as_iterable]
+        self.thresholds = _as_tuple(km_thresholds)
         super().__init__(
             col_name_or_names={
                 "latitude_column": lat_col,
@@ -573,6 +602,8 @@ class DistanceInKMAtThresholds(ComparisonCreator):
 
 
 class CustomComparison(ComparisonCreator):
+    __slots__ = ("_output_column_name", "_comparison_levels", "_description")
+
     def __init__(
         self,
         comparison_levels: List[Union[ComparisonLevelCreator, dict[str, Any]]],
@@ -618,6 +649,17 @@ class CustomComparison(ComparisonCreator):
         return comparison_creator
 
 
+@lru_cache(maxsize=8)
+def _damerau_levenshtein_or_levenshtein_function_name(
+    sql_dialect: SplinkDialect,
+) -> str:
+    # resolved once per dialect, rather than raising and catching on every call
+    try:
+        return sql_dialect.damerau_levenshtein_function_name
+    except NotImplementedError:
+        return sql_dialect.levenshtein_function_name
+
+
 class _DamerauLevenshteinIfSupportedElseLevenshteinLevel(ComparisonLevelCreator):
     def __init__(self, col_name: Union[str, ColumnExpression], distance_threshold: int):
         self.col_expression = ColumnExpression.instantiate_if_str(col_name)
@@ -626,10 +668,7 @@ class _DamerauLevenshteinIfSupportedElseLevenshteinLevel(ComparisonLevelCreator)
     def create_sql(self, sql_dialect: SplinkDialect) -> str:
         self.col_expression.sql_dialect = sql_dialect
         col = self.col_expression
-        try:
-            lev_fn = sql_dialect.damerau_levenshtein_function_name
-        except NotImplementedError:
-            lev_fn = sql_dialect.levenshtein_function_name
+        lev_fn = _damerau_levenshtein_or_levenshtein_function_name(sql_dialect)
         return f"{lev_fn}({col.name_l}, {col.name_r}) <= {self.distance_threshold}"
 
     def create_label_for_charts(self) -> str:
@@ -638,6 +677,15 @@ class _DamerauLevenshteinIfSupportedElseLevenshteinLevel(ComparisonLevelCreator)
 
 
 class DateOfBirthComparison(ComparisonCreator):
+    __slots__ = (
+        "datetime_thresholds",
+        "datetime_metrics",
+        "_threshold_metric_pairs",
+        "datetime_format",
+        "input_is_string",
+        "invalid_dates_as_null",
+    )
+
     def __init__(
         self,
         col_name: Union[str, ColumnExpression],
@@ -683,10 +731,8 @@ class DateOfBirthComparison(ComparisonCreator):
                 or both are an invalid date.  Only used if input is a string.  Defaults
                 to True.
         """
-        date_thresholds_as_iterable = ensure_is_iterable(datetime_thresholds)
-        self.datetime_thresholds = [*date_thresholds_as_iterable]
-        date_metrics_as_iterable = ensure_is_iterable(datetime_metrics)
-        self.datetime_metrics = [*date_metrics_as_iterable]
+        self.datetime_thresholds = _as_tuple(datetime_thresholds)
+        self.datetime_metrics = _as_tuple(datetime_metrics)
 
         num_metrics = len(self.datetime_metrics)
         num_thresholds = len(self.datetime_thresholds)
@@ -699,6 +745,9 @@ class DateOfBirthComparison(ComparisonCreator):
                 "`date_thresholds` and `date_metrics` must have "
                 "the same number of entries"
             )
+        self._threshold_metric_pairs = tuple(
+            zip(self.datetime_thresholds, self.datetime_metrics)
+        )
 
         self.datetime_format = datetime_format
 
@@ -738,10 +787,8 @@ class DateOfBirthComparison(ComparisonCreator):
             ).configure(label_for_charts="DamerauLevenshtein distance <= 1")
         )
 
-        if self.datetime_thresholds:
-            for threshold, metric in zip(
-                self.datetime_thresholds, self.datetime_metrics
-            ):
+        if self._threshold_metric_pairs:
+            for threshold, metric in self._threshold_metric_pairs:
                 levels.append(
                     cll.AbsoluteDateDifferenceLevel(
                         self.col_expression,
@@ -761,11 +808,27 @@ class DateOfBirthComparison(ComparisonCreator):
 
 
 class PostcodeComparison(ComparisonCreator):
+    __slots__ = ("valid_postcode_regex", "km_thresholds")
+
     SECTOR_REGEX = "^[A-Za-z]{1,2}[0-9][A-Za-z0-9]? [0-9]"
     DISTRICT_REGEX = "^[A-Za-z]{1,2}[0-9][A-Za-z0-9]?"
     AREA_REGEX = "^[A-Za-z]{1,2}"
     VALID_POSTCODE_REGEX = "^[A-Za-z]{1,2}[0-9][A-Za-z0-9]? [0-9][A-Za-z]{2}$"
 
+    # exact match levels as (pattern to extract, label for charts), from most to
+    # least specific. A pattern of None means a match on the full postcode, and a
+    # label of None leaves the level's default label
+    _EXACT_MATCH_SPECS: tuple[tuple[Optional[str], Optional[str]], ...] = (
+        (None, "Exact match on full postcode"),
+        (SECTOR_REGEX, "Exact match on sector"),
+        (DISTRICT_REGEX, "Exact match on district"),
+        (AREA_REGEX, "Exact match on area"),
+    )
+    _EXACT_MATCH_SPECS_WITH_KM: tuple[tuple[Optional[str], Optional[str]], ...] = (
+        (None, None),
+        (SECTOR_REGEX, None),
+    )
+
     def __init__(
         self,
         col_name: Union[str, ColumnExpression],
@@ -815,10 +878,9 @@ class PostcodeComparison(ComparisonCreator):
 
         cols = {"postcode": col_name}
 
-        km_thresholds_as_iterable = ensure_is_iterable(km_thresholds)
-        self.km_thresholds = [*km_thresholds_as_iterable]
+        self.km_thresholds = _as_tuple(km_thresholds)
         if lat_col is None or long_col is None:
-            self.km_thresholds = []
+            self.km_thresholds = ()
         else:
             cols["latitude"] = lat_col
             cols["longitude"] = long_col
@@ -827,41 +889,30 @@ class PostcodeComparison(ComparisonCreator):
 
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
         full_col_expression = self.col_expressions["postcode"]
-        sector_col_expression = full_col_expression.regex_extract(self.SECTOR_REGEX)
-        district_col_expression = full_col_expression.regex_extract(self.DISTRICT_REGEX)
-        area_col_expression = full_col_expression.regex_extract(self.AREA_REGEX)
-
-        levels: list[ComparisonLevelCreator] = []
-
-        if len(self.km_thresholds) == 0:
-            levels = [
-                cll.NullLevel(
-                    full_col_expression, valid_string_pattern=self.valid_postcode_regex
-                ),
-                cll.ExactMatchLevel(full_col_expression).configure(
-                    label_for_charts="Exact match on full postcode"
-                ),
-                cll.ExactMatchLevel(sector_col_expression).configure(
-                    label_for_charts="Exact match on sector"
-                ),
-                cll.ExactMatchLevel(district_col_expression).configure(
-                    label_for_charts="Exact match on district"
-                ),
-                cll.ExactMatchLevel(area_col_expression).configure(
-                    label_for_charts="Exact match on area"
-                ),
-            ]
+
+        # Don't include the very high level postcode categories
+        # if using km thresholds - they are better modelled as geo distances
         if len(self.km_thresholds) > 0:
-            # Don't include the very high level postcode categories
-            # if using km thresholds - they are better modelled as geo distances
-            levels = [
-                cll.NullLevel(
-                    full_col_expression, valid_string_pattern=self.valid_postcode_regex
-                ),
-                cll.ExactMatchLevel(full_col_expression),
-                cll.ExactMatchLevel(sector_col_expression),
-            ]
+            exact_match_specs = self._EXACT_MATCH_SPECS_WITH_KM
+        else:
+            exact_match_specs = self._EXACT_MATCH_SPECS
+
+        levels: list[ComparisonLevelCreator] = [
+            cll.NullLevel(
+                full_col_expression, valid_string_pattern=self.valid_postcode_regex
+            )
+        ]
+        for pattern, label in exact_match_specs:
+            level = cll.ExactMatchLevel(
+                full_col_expression
+                if pattern is None
+                else full_col_expression.regex_extract(pattern)
+            )
+            if label is not None:
+                level.configure(label_for_charts=label)
+            levels.append(level)
 
+        if len(self.km_thresholds) > 0:
             lat_col_expression = self.col_expressions["latitude"]
             long_col_expression = self.col_expressions["longitude"]
             for km_threshold in self.km_thresholds:
@@ -879,6 +930,8 @@ class PostcodeComparison(ComparisonCreator):
 
 
 class EmailComparison(ComparisonCreator):
+    __slots__ = ()
+
     USERNAME_REGEX = "^[^@]+"
     DOMAIN_REGEX = "@([^@]+)$"
 
@@ -930,6 +983,8 @@ class EmailComparison(ComparisonCreator):
 
 
 class NameComparison(ComparisonCreator):
+    __slots__ = ("jaro_winkler_thresholds", "dmeta_col")
+
     def __init__(
         self,
         col_name: Union[str, ColumnExpression],
@@ -965,8 +1020,7 @@ class NameComparison(ComparisonCreator):
                 contain arrays of dmetaphone values, which are of length 1 or 2.
         """
 
-        jaro_winkler_thresholds_itr = ensure_is_iterable(jaro_winkler_thresholds)
-        self.jaro_winkler_thresholds = list(jaro_winkler_thresholds_itr)
+        self.jaro_winkler_thresholds = _as_tuple(jaro_winkler_thresholds)
 
         cols = {"name": col_name}
         if dmeta_col_name is not None:
@@ -1015,6 +1069,8 @@ class NameComparison(ComparisonCreator):
 
 
 class ForenameSurnameComparison(ComparisonCreator):
+    __slots__ = ("jaro_winkler_thresholds",)
+
     def __init__(
         self,
         forename_col_name: Union[str, ColumnExpression],
@@ -1054,8 +1110,7 @@ class ForenameSurnameComparison(ComparisonCreator):
                 concatenated forename and surname values. If provided, term
                 frequencies are applied on the exact match using this column
         """
-        jaro_winkler_thresholds_itr = ensure_is_iterable(jaro_winkler_thresholds)
-        self.jaro_winkler_thresholds = list(jaro_winkler_thresholds_itr)
+        self.jaro_winkler_thresholds = _as_tuple(jaro_winkler_thresholds)
         cols = {"forename": forename_col_name, "surname": surname_col_name}
         if forename_surname_concat_col_name is not None:
             cols["forename_surname_concat"] = forename_surname_concat_col_name
@@ -1121,6 +1176,8 @@ class ForenameSurnameComparison(ComparisonCreator):
 
 
 class CosineSimilarityAtThresholds(ComparisonCreator):
+    __slots__ = ("thresholds",)
+
     def __init__(
         self,
         col_name: str,
@@ -1146,8 +1203,7 @@ class CosineSimilarityAtThresholds(ComparisonCreator):
                 Defaults to [0.9, 0.7].
         """
 
-        thresholds_as_iterable = ensure_is_iterable(score_threshold_or_thresholds)
-        self.thresholds = [*thresholds_as_iterable]
+        self.thresholds = _as_tuple(score_threshold_or_thresholds)
         super().__init__(col_name)
 
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from splink.internals.comparison_level_library import (
         AbsoluteTimeDifferenceLevel,
         ArrayIntersectLevel,
+        LevenshteinLevel,
     )
 
 # equivalent to typing.Self in python >= 3.11
@@ -419,6 +420,14 @@ class PostgresDialect(SplinkDialect):
     def levenshtein_function_name(self):
         return "levenshtein"
 
+    def levenshtein_at_threshold(self, clc: LevenshteinLevel) -> str:
+        # fuzzystrmatch's bounded variant stops once the distance exceeds the
+        # threshold, returning something larger than it, so the condition is
+        # equivalent to comparing the full levenshtein distance
+        col = clc.col_expression
+        thres = clc.distance_threshold
+        return f"levenshtein_less_equal({col.name_l}, {col.name_r}, {thres}) <= {thres}"
+
     def absolute_time_difference(self, clc: AbsoluteTimeDifferenceLevel) -> str:
         # need custom solution as sqlglot gets confused by 'metric', as in Spark
         # datediff _only_ works in days
@@ -9,7 +9,6 @@ from typing import Any, List, Literal, Union
 from splink.internals.blocking_rule_creator import BlockingRuleCreator
 from splink.internals.blocking_rule_creator_utils import to_blocking_rule_creator
 from splink.internals.comparison_creator import ComparisonCreator
-from splink.internals.comparison_library import CustomComparison
 
 from .settings import Settings
 
@@ -59,6 +58,10 @@ class SettingsCreator:
         Returns class as a dict where we have converted any sub-dicts into
         'creator' types
         """
+        # deferred, so that `import splink` does not pull in the comparison
+        # (and comparison level) libraries
+        from splink.internals.comparison_library import CustomComparison
+
         creator_dict = self._as_naive_dict()
         # we adjust dict to ensure that comparisons + blocking rules are
         # consistently of creatore types
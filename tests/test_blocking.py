@@ -1,4 +1,8 @@
 from splink.internals.blocking import BlockingRule, blocking_rule_to_obj
+from splink.internals.blocking_rule_creator_utils import (
+    blocking_rule_args_to_list_of_blocking_rules,
+    to_blocking_rule_creator,
+)
 from splink.internals.blocking_rule_library import block_on
 from splink.internals.input_column import _get_dialect_quotes
 from splink.internals.linker import Linker
@@ -73,3 +77,82 @@ def test_simple_end_to_end(test_helpers, dialect):
     linker.training.estimate_parameters_using_expectation_maximisation(block_on("dob"))
 
     linker.inference.predict()
+
+
+@mark_with_dialects_excluding()
+def test_blocking_rule_args_to_list_of_blocking_rules(dialect):
+    q, _ = _get_dialect_quotes(dialect)
+    rule_args = [
+        "l.first_name = r.first_name",
+        block_on("surname"),
+        "l.first_name = r.first_name",
+    ]
+    brs = blocking_rule_args_to_list_of_blocking_rules(rule_args, dialect)
+
+    assert [br.blocking_rule_sql for br in brs] == [
+        "l.first_name = r.first_name",
+        f"l.{q}surname{q} = r.{q}surname{q}",
+        "l.first_name = r.first_name",
+    ]
+    assert all(br.sqlglot_dialect == brs[1].sqlglot_dialect for br in brs)
+
+    # each rule must get its own BlockingRule, as these are mutated when
+    # preceding rules are added
+    assert brs[0] is not brs[2]
+    brs[2].add_preceding_rules(brs[:2])
+    assert brs[0].preceding_rules == []
+
+    (br,) = blocking_rule_args_to_list_of_blocking_rules(
+        "l.first_name = r.first_name", dialect
+    )
+    assert br.blocking_rule_sql == "l.first_name = r.first_name"
+    assert br.preceding_rules == []
+
+    # creators handed back to callers are not shared
+    rule_text = "l.first_name = r.first_name"
+    assert to_blocking_rule_creator(rule_text) is not to_blocking_rule_creator(
+        rule_text
+    )
+
+
+def test_custom_rule_py_predicate():
+    rule = to_blocking_rule_creator(
+        "l.first_name = r.first_name and substr(l.dob, 1, 4) = substr(r.dob, 1, 4)"
+    )
+    predicate = rule.py_predicate
+    assert predicate is not None
+
+    left = {"first_name": "john", "dob": "1990-01-01"}
+    assert predicate(left, {"first_name": "john", "dob": "1990-12-31"})
+    assert not predicate(left, {"first_name": "john", "dob": "1991-01-01"})
+    assert not predicate(left, {"first_name": "jon", "dob": "1990-01-01"})
+    # as in SQL, nulls never match
+    assert not predicate(
+        {"first_name": None, "dob": "1990-01-01"},
+        {"first_name": None, "dob": "1990-01-01"},
+    )
+
+    predicate = to_blocking_rule_creator("lower(l.city) = lower(r.city)").py_predicate
+    assert predicate({"city": "London"}, {"city": "LONDON"})
+
+    # as in SQL, string functions cast non-string values
+    predicate = to_blocking_rule_creator(
+        "substr(l.dob, 1, 4) = substr(r.dob, 1, 4)"
+    ).py_predicate
+    assert predicate({"dob": 19900101}, {"dob": 19901231})
+    assert not predicate({"dob": 19900101}, {"dob": 19910101})
+
+    predicate = to_blocking_rule_creator('l."First_Name" = r."First_Name"').py_predicate
+    assert predicate({"First_Name": "john"}, {"First_Name": "john"})
+
+    unsupported_rules = [
+        "l.first_name = r.first_name or l.surname = r.surname",
+        "levenshtein(l.first_name, r.first_name) <= 2",
+        "l.first_name = l.surname",
+        "l.first_name = 'john'",
+        "x.l.first_name = y.r.first_name",
+        # unquoted, so case-insensitive in SQL
+        "l.First_Name = r.first_name",
+    ]
+    for unsupported_rule in unsupported_rules:
+        assert to_blocking_rule_creator(unsupported_rule).py_predicate is None
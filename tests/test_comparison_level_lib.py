@@ -223,6 +223,17 @@ def test_levenshtein_level(test_helpers, dialect):
     run_comparison_vector_value_tests(test_cases, db_api)
 
 
+def test_levenshtein_level_bounded_in_postgres():
+    level = cll.LevenshteinLevel("name", 2)
+
+    postgres_sql = level.get_comparison_level("postgres").sql_condition
+    assert postgres_sql.startswith("levenshtein_less_equal(")
+    assert postgres_sql.endswith(", 2) <= 2")
+
+    duckdb_sql = level.get_comparison_level("duckdb").sql_condition
+    assert duckdb_sql.startswith("levenshtein(")
+
+
 # postgres has no Damerau-Levenshtein
 @mark_with_dialects_excluding("postgres")
 def test_damerau_levenshtein_level(test_helpers, dialect):
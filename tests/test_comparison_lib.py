@@ -1,7 +1,9 @@
 import pandas as pd
 
+import splink.internals.comparison_level_library as cll
 import splink.internals.comparison_library as cl
 from splink.internals.column_expression import ColumnExpression
+from splink.internals.comparison_creator import ComparisonCreator
 from splink.internals.duckdb.database_api import DuckDBAPI
 from splink.internals.linker import Linker
 from tests.decorator import mark_with_dialects_excluding
@@ -97,3 +99,52 @@ def test_set_to_lowercase(test_helpers, dialect):
     ]
 
     run_comparison_vector_value_tests(test_cases, db_api)
+
+
+def test_configuring_comparison_does_not_alter_cached_levels():
+    comparison = cl.LevenshteinAtThresholds("first_name", [1, 2])
+
+    configured_levels = comparison.configure(
+        term_frequency_adjustments=True,
+        m_probabilities=[0.7, 0.2, 0.05, 0.05],
+    ).get_configured_comparison_levels()
+    assert configured_levels[1].term_frequency_adjustments
+    assert configured_levels[1].m_probability == 0.7
+
+    # a freshly configured set of levels is produced on each call
+    assert comparison.get_configured_comparison_levels()[1] is not configured_levels[1]
+
+    # the underlying levels are untouched by the configuration
+    for level in comparison._get_comparison_levels():
+        assert not level.term_frequency_adjustments
+        assert getattr(level, "m_probability", None) is None
+    assert comparison.num_levels == 5
+    assert comparison.num_non_null_levels == 4
+
+
+def test_levels_reflect_state_set_after_init():
+    class LevenshteinAtSetThreshold(ComparisonCreator):
+        threshold = 9
+
+        def __init__(self, col_name):
+            super().__init__(col_name)
+            self.threshold = 3
+
+        def create_comparison_levels(self):
+            return [
+                cll.NullLevel(self.col_expression),
+                cll.LevenshteinLevel(self.col_expression, self.threshold),
+                cll.ElseLevel(),
+            ]
+
+        def create_output_column_name(self):
+            return self.col_expression.output_column_name
+
+    comparison = LevenshteinAtSetThreshold("a").get_comparison("duckdb")
+    assert comparison.comparison_levels[1].sql_condition.endswith("<= 3")
+
+    comparison_creator = cl.LevenshteinAtThresholds("a", [1, 2])
+    comparison_creator.thresholds = (4,)
+    comparison = comparison_creator.get_comparison("duckdb")
+    assert comparison.comparison_levels[2].sql_condition.endswith("<= 4")
+    assert len(comparison.comparison_levels) == 4